@@ -7,11 +7,15 @@ app = marimo.App(width="medium")
 @app.cell
 def _():
     import marimo as mo
-    import json
+    from concurrent.futures import ThreadPoolExecutor
     from pathlib import Path
     import polars as pl
     from collections import Counter, defaultdict
-    return Path, json, mo, pl
+
+    # Bound the batch size used by the streaming engine so the pipelined
+    # concat + aggregates work in cache-friendly chunks.
+    pl.Config.set_streaming_chunk_size(65536)
+    return Path, ThreadPoolExecutor, mo, pl
 
 
 @app.cell
@@ -26,72 +30,166 @@ def _(mo):
 
 
 @app.cell
-def _(Path, json, pl):
+def _(Path, ThreadPoolExecutor, pl):
+    def _read_letter_file(letter_file):
+        try:
+            return pl.read_json(letter_file).with_columns(
+                pl.lit(letter_file.stem).alias("letter")
+            )
+        except Exception as e:
+            print(f"Error loading {letter_file}: {e}")
+            return None
+
+
     def load_language_data(language="ngiemboon", source_lang="en"):
-        """Load all JSON files for a language and source language."""
+        """Load all JSON files for a language/source pair as a LazyFrame.
+
+        The cleaned frame is cached to Parquet so subsequent runs skip JSON
+        parsing entirely and scan the columnar cache instead.
+        """
         base_path = Path("scraped_data") / language / source_lang
 
         if not base_path.exists():
-            return pl.DataFrame()
+            return pl.LazyFrame()
+
+        files = [p for p in base_path.iterdir() if p.suffix == ".json"]
+        files.sort(key=lambda p: p.name)
 
-        all_entries = []
+        if not files:
+            return pl.LazyFrame()
 
-        for letter_file in sorted(base_path.glob("*.json")):
-            try:
-                with open(letter_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+        cache_path = Path("cache") / f"{language}_{source_lang}.parquet"
+        newest_source = max(f.stat().st_mtime for f in files)
 
-                for entry in data:
-                    source_word = entry.get(source_lang, entry.get("english", entry.get("french", "")))
-                    letter = letter_file.stem
+        if cache_path.exists() and cache_path.stat().st_mtime >= newest_source:
+            return pl.scan_parquet(cache_path)
 
-                    for translation in entry.get(language, []):
-                        all_entries.append({
-                            "letter": letter,
-                            "source_language": source_lang,
-                            "source_word": source_word,
-                            "target_word": translation.get("word", ""),
-                            "link": translation.get("link", "")
-                        })
-            except Exception as e:
-                print(f"Error loading {letter_file}: {e}")
+        # Let Polars parse each letter file natively so the data stays in
+        # Arrow columnar memory, and read the files concurrently — the
+        # Rust JSON parser releases the GIL, so I/O and parsing overlap.
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            frames = [f for f in executor.map(_read_letter_file, files) if f is not None]
 
-        return pl.DataFrame(all_entries)
+        if not frames:
+            return pl.LazyFrame()
 
+        df = pl.concat(frames, how="diagonal_relaxed")
+        source_cols = [c for c in (source_lang, "english", "french") if c in df.columns]
 
-    # Load both English and French data
+        cleaned = (
+            df.lazy()
+            .with_columns(
+                pl.lit(source_lang).alias("source_language"),
+                pl.coalesce([pl.col(c) for c in source_cols]).alias("source_word"),
+            )
+            .explode(language)
+            .unnest(language)
+            .rename({"word": "target_word"})
+            .filter(pl.col("target_word").is_not_null())
+            .select(["letter", "source_language", "source_word", "target_word", "link"])
+            .collect()
+        )
+
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cleaned.write_parquet(cache_path, compression="zstd", statistics=True)
+
+        return pl.scan_parquet(cache_path)
+
+
+    # Load both English and French data (kept lazy so downstream queries
+    # can share scans and benefit from predicate/projection pushdown)
     df_english = load_language_data("ngiemboon", "en")
     df_french = load_language_data("ngiemboon", "fr")
 
-    # Combine both datasets
-    df_all = pl.concat([df_english, df_french])
+    # Combine both datasets (still lazy: the streaming engine pipelines
+    # the concat into downstream aggregates without a full intermediate)
+    df_all = pl.concat([df_english, df_french], how="vertical_relaxed")
     return df_all, df_english, df_french
 
 
 @app.cell
-def _(df_all, df_english, df_french, mo):
+def _(df_all, df_english, df_french, mo, pl):
+    _counts = pl.collect_all([
+        df_all.select(pl.len()),
+        df_english.select(pl.len()),
+        df_french.select(pl.len()),
+        df_english.select(pl.col("source_word").n_unique()),
+        df_french.select(pl.col("source_word").n_unique()),
+    ])
+    _total_all, _total_en, _total_fr, _unique_en, _unique_fr = (
+        df.item() for df in _counts
+    )
+
     mo.md(f"""
     ## Dataset Overview
 
-    - **Total entries (all languages)**: {len(df_all):,}
-    - **English entries**: {len(df_english):,}
-    - **French entries**: {len(df_french):,}
-    - **Unique English words**: {df_english.select("source_word").n_unique():,}
-    - **Unique French words**: {df_french.select("source_word").n_unique():,}
+    - **Total entries (all languages)**: {_total_all:,}
+    - **English entries**: {_total_en:,}
+    - **French entries**: {_total_fr:,}
+    - **Unique English words**: {_unique_en:,}
+    - **Unique French words**: {_unique_fr:,}
     """)
     return
 
 
 @app.cell
-def _(df_all, mo, pl):
-    # Distribution by letter
-    letter_distribution = (
+def _(df_all, pl):
+    # Build all aggregate queries lazily and materialize them in a single
+    # collect_all so the optimizer can share the underlying scans.
+    letter_distribution_lf = (
         df_all
         .group_by(["letter", "source_language"])
         .agg(pl.count("source_word").alias("count"))
         .sort("letter")
     )
 
+    translation_counts_lf = (
+        df_all
+        .group_by(["source_language", "source_word"])
+        .agg(pl.count("target_word").alias("num_translations"))
+        .sort("num_translations", descending=True)
+        .head(20)
+    )
+
+    word_stats_lf = (
+        df_all
+        .with_columns([
+            pl.col("source_word").str.len_chars().alias("source_length"),
+            pl.col("target_word").str.len_chars().alias("target_length")
+        ])
+        .group_by("source_language")
+        .agg([
+            pl.col("source_length").mean().alias("avg_source_length"),
+            pl.col("target_length").mean().alias("avg_target_length"),
+            pl.col("source_length").max().alias("max_source_length"),
+            pl.col("target_length").max().alias("max_target_length")
+        ])
+    )
+
+    unique_targets_lf = (
+        df_all
+        .group_by("source_language")
+        .agg([
+            pl.col("target_word").n_unique().alias("unique_target_words"),
+            pl.col("source_word").n_unique().alias("unique_source_words")
+        ])
+    )
+
+    letter_distribution, translation_counts, word_stats, unique_targets = pl.collect_all(
+        [
+            letter_distribution_lf,
+            translation_counts_lf,
+            word_stats_lf,
+            unique_targets_lf,
+        ],
+        engine="streaming",
+    )
+    return letter_distribution, translation_counts, word_stats, unique_targets
+
+
+@app.cell
+def _(letter_distribution, mo):
+    # Distribution by letter
     mo.ui.table(letter_distribution, selection=None)
     return
 
@@ -106,57 +204,57 @@ def _(mo):
 
 @app.cell
 def _(df_english, df_french):
-    # Find common source words between French and English
-    english_words = set(df_english.select("source_word").to_series().to_list())
-    french_words = set(df_french.select("source_word").to_series().to_list())
-
-    common_words = english_words & french_words
+    # Find common source words between French and English with an inner
+    # join on the unique word sets — no Arrow→Python set round-trip
+    common_words = (
+        df_english.select("source_word").unique()
+        .join(df_french.select("source_word").unique(), on="source_word", how="inner")
+        .collect()
+        .to_series()
+        .sort()
+    )
 
     print(f"Total common words: {len(common_words):,}")
     print(f"\nExamples of common words:")
-    for word in sorted(list(common_words))[:20]:
+    for word in common_words.head(20):
         print(f"  - {word}")
     return (common_words,)
 
 
 @app.cell
-def _(df_english, df_french, mo, pl):
-    # Common words by letter
-    def get_common_words_by_letter():
-        results = []
-
-        for letter in "abcdefghijklmnopqrstuvwxyz":
-            en_words = set(
-                df_english
-                .filter(pl.col("letter") == letter)
-                .select("source_word")
-                .to_series()
-                .to_list()
-            )
-
-            fr_words = set(
-                df_french
-                .filter(pl.col("letter") == letter)
-                .select("source_word")
-                .to_series()
-                .to_list()
+def _(df_all, mo, pl):
+    # Common words by letter — one vectorized group-by + pivot instead of
+    # 26 per-letter scans of each frame
+    common_by_letter = (
+        df_all
+        .group_by(["letter", "source_language"])
+        .agg(pl.col("source_word").unique().alias("words"))
+        .collect()
+        .pivot(values="words", index="letter", on="source_language")
+        .lazy()
+        .with_columns(
+            pl.col("en").list.set_intersection(pl.col("fr")).list.sort().alias("common")
+        )
+        .with_columns(
+            pl.col("en").list.len().fill_null(0).alias("english_words"),
+            pl.col("fr").list.len().fill_null(0).alias("french_words"),
+            pl.col("common").list.len().fill_null(0).alias("common_words"),
+        )
+        .with_columns(
+            pl.when(pl.max_horizontal("english_words", "french_words") > 0)
+            .then(
+                (pl.col("common_words") * 100 / pl.max_horizontal("english_words", "french_words"))
+                .round(2)
             )
+            .otherwise(0.0)
+            .alias("overlap_pct"),
+            pl.col("common").list.head(5).list.join(", ").fill_null("").alias("examples"),
+        )
+        .select(["letter", "english_words", "french_words", "common_words", "overlap_pct", "examples"])
+        .sort("letter")
+        .collect()
+    )
 
-            common = en_words & fr_words
-
-            results.append({
-                "letter": letter,
-                "english_words": len(en_words),
-                "french_words": len(fr_words),
-                "common_words": len(common),
-                "overlap_pct": round(len(common) / max(len(en_words), len(fr_words)) * 100, 2) if max(len(en_words), len(fr_words)) > 0 else 0,
-                "examples": ", ".join(sorted(list(common))[:5]) if common else ""
-            })
-
-        return pl.DataFrame(results)
-
-
-    common_by_letter = get_common_words_by_letter()
     mo.ui.table(common_by_letter, selection=None)
     return (common_by_letter,)
 
@@ -167,13 +265,19 @@ def _(common_by_letter, mo):
     import altair as alt
 
     chart = (
-        alt.Chart(common_by_letter.to_pandas())
+        alt.Chart(alt.Data(values=common_by_letter.to_dicts()))
         .mark_bar()
         .encode(
             x=alt.X("letter:N", title="Letter"),
             y=alt.Y("overlap_pct:Q", title="Overlap Percentage (%)"),
             color=alt.Color("overlap_pct:Q", scale=alt.Scale(scheme="viridis")),
-            tooltip=["letter", "english_words", "french_words", "common_words", "overlap_pct"]
+            tooltip=[
+                "letter:N",
+                "english_words:Q",
+                "french_words:Q",
+                "common_words:Q",
+                "overlap_pct:Q",
+            ]
         )
         .properties(
             title="French-English Word Overlap by Letter",
@@ -195,40 +299,28 @@ def _(mo):
 
 
 @app.cell
-def _(df_all, mo, pl):
+def _(mo, translation_counts):
     # Words with most translations
-    translation_counts = (
-        df_all
-        .group_by(["source_language", "source_word"])
-        .agg(pl.count("target_word").alias("num_translations"))
-        .sort("num_translations", descending=True)
-        .head(20)
-    )
-
     mo.ui.table(translation_counts, selection=None)
     return
 
 
 @app.cell
 def _(df_english, df_french, pl):
-    # Compare translations for common words
+    # Factorize once, reuse many: one hash aggregation per frame builds a
+    # word → translations map, and each comparison is then an O(1) lookup.
+    def _translation_map(df):
+        index = df.group_by("source_word").agg(pl.col("target_word")).collect()
+        return dict(zip(index["source_word"].to_list(), index["target_word"].to_list()))
+
+
+    _en_by_word = _translation_map(df_english)
+    _fr_by_word = _translation_map(df_french)
+
     def get_translation_comparison(word):
         """Compare French and English translations for a given word."""
-        en_translations = (
-            df_english
-            .filter(pl.col("source_word") == word)
-            .select("target_word")
-            .to_series()
-            .to_list()
-        )
-
-        fr_translations = (
-            df_french
-            .filter(pl.col("source_word") == word)
-            .select("target_word")
-            .to_series()
-            .to_list()
-        )
+        en_translations = _en_by_word.get(word, [])
+        fr_translations = _fr_by_word.get(word, [])
 
         common_translations = set(en_translations) & set(fr_translations)
 
@@ -260,25 +352,7 @@ def _(common_words, get_translation_comparison):
 
 
 @app.cell
-def _(df_all, mo, pl):
-    # Statistics on word lengths
-    word_stats = (
-        df_all
-        .with_columns([
-            pl.col("source_word").str.len_chars().alias("source_length"),
-            pl.col("target_word").str.len_chars().alias("target_length")
-        ])
-        .select([
-            pl.col("source_language"),
-            pl.col("source_length").mean().alias("avg_source_length"),
-            pl.col("target_length").mean().alias("avg_target_length"),
-            pl.col("source_length").max().alias("max_source_length"),
-            pl.col("target_length").max().alias("max_target_length")
-        ])
-        .group_by("source_language")
-        .first()
-    )
-
+def _(mo, word_stats):
     mo.md(f"""
     ## Word Length Statistics
 
@@ -288,17 +362,7 @@ def _(df_all, mo, pl):
 
 
 @app.cell
-def _(df_all, mo, pl):
-    # Unique target words
-    unique_targets = (
-        df_all
-        .group_by("source_language")
-        .agg([
-            pl.col("target_word").n_unique().alias("unique_target_words"),
-            pl.col("source_word").n_unique().alias("unique_source_words")
-        ])
-    )
-
+def _(mo, unique_targets):
     mo.md(f"""
     ## Vocabulary Coverage
 
@@ -1,5 +1,4 @@
 import os
-from functools import lru_cache
 from typing import Annotated
 from fastapi import Depends
 
@@ -8,32 +7,53 @@ from app.services import LanguageService, TranslationService
 
 DEFAULT_DB_PATH = os.getenv("VERNALA_DB_PATH", "vernala.db")
 
-@lru_cache()
+# Eager module-level singletons: Depends() invokes the getter on every
+# request, so the getters stay zero-branch attribute loads instead of
+# paying an lru_cache hash+lookup per request.
+_translation_repo = TranslationRepository(DEFAULT_DB_PATH)
+_language_repo = LanguageRepository(DEFAULT_DB_PATH)
+_language_service = LanguageService(language_repo=_language_repo)
+_translation_service = TranslationService(
+    translation_repo=_translation_repo,
+    language_service=_language_service
+)
+
+
 def get_translation_repository() -> TranslationRepository:
-    return TranslationRepository(DEFAULT_DB_PATH)
+    return _translation_repo
+
 
-@lru_cache()
 def get_language_repository() -> LanguageRepository:
-    return LanguageRepository(DEFAULT_DB_PATH)
-
-@lru_cache()
-def get_language_service(
-    language_repo: LanguageRepository = Depends(get_language_repository)
-) -> LanguageService:
-    return LanguageService(language_repo=language_repo)
-
-
-@lru_cache()
-def get_translation_service(
-    translation_repo: TranslationRepository = Depends(get_translation_repository),
-    language_service: LanguageService = Depends(get_language_service)
-) -> TranslationService:
-    return TranslationService(
-        translation_repo=translation_repo,
-        language_service=language_service
+    return _language_repo
+
+
+def get_language_service() -> LanguageService:
+    return _language_service
+
+
+def get_translation_service() -> TranslationService:
+    return _translation_service
+
+
+def reset_dependencies(db_path: str | None = None) -> None:
+    """
+    Rebuild the singletons against a different database path.
+
+    Primarily used by tests to point the app at a temporary database.
+    """
+    global _translation_repo, _language_repo, _language_service, _translation_service
+
+    path = db_path or DEFAULT_DB_PATH
+    _translation_repo = TranslationRepository(path)
+    _language_repo = LanguageRepository(path)
+    _language_service = LanguageService(language_repo=_language_repo)
+    _translation_service = TranslationService(
+        translation_repo=_translation_repo,
+        language_service=_language_service
     )
 
+
 TranslationRepositoryDep = Annotated[TranslationRepository, Depends(get_translation_repository)]
 LanguageRepositoryDep = Annotated[LanguageRepository, Depends(get_language_repository)]
 LanguageServiceDep = Annotated[LanguageService, Depends(get_language_service)]
-TranslationServiceDep = Annotated[TranslationService, Depends(get_translation_service)]
\ No newline at end of file
+TranslationServiceDep = Annotated[TranslationService, Depends(get_translation_service)]
@@ -1,8 +1,30 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.routes.health_router import router as health_router
 from app.routes.translate_router import router as translate_router
 from app.routes.languages_router import router as languages_router
+from app.dependencies import get_language_service
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Generate the OpenAPI schema at startup (app.openapi() caches it) so
+    # the first /docs or /openapi.json request doesn't pay the cost.
+    app.openapi()
+
+    # Warm the frozen language-code validation set so the first translate
+    # request doesn't pay the repository round-trip.
+    try:
+        get_language_service().get_valid_language_codes()
+    except Exception:
+        # Database may not exist yet (e.g. before migration); the cache
+        # then populates lazily on first use.
+        pass
+
+    yield
+
 
 app = FastAPI(
     title="Vernala Translation API",
@@ -11,18 +33,19 @@ app = FastAPI(
     contact={
         "name": "Vernala Project",
     },
+    lifespan=lifespan,
 )
 
 app.include_router(health_router)
 app.include_router(translate_router)
 app.include_router(languages_router)
 
+# Wildcard origins without credentials: browsers reject "*" combined with
+# allow_credentials, and dropping it lets Starlette answer preflights with
+# the precomputed wildcard headers instead of a per-origin compare.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "*"
-    ],
-    allow_credentials=True,
+    allow_origins=["*"],
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -115,7 +115,7 @@ class LanguagesResponse(BaseModel):
 
 
 class ErrorResponse(BaseModel):
-    detail: str = Field(..., description="Error message")
+    detail: str | dict = Field(..., description="Error message or structured error detail")
 
     model_config = {
         "json_schema_extra": {
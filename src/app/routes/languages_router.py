@@ -1,9 +1,17 @@
-from fastapi import APIRouter, HTTPException
+import hashlib
+import time
+
+from fastapi import APIRouter, HTTPException, Request, Response
 from app.models import LanguagesResponse, ErrorResponse
 from app.dependencies import LanguageServiceDep
 
 router = APIRouter(prefix="/languages", tags=["Languages"])
 
+# The language list only changes on database rebuilds, so cache the
+# serialized body for a while: (built_at, body, etag)
+_CACHE_TTL_SECONDS = 300.0
+_cache: tuple[float, bytes, str] | None = None
+
 
 @router.get(
     "",
@@ -13,15 +21,34 @@ router = APIRouter(prefix="/languages", tags=["Languages"])
     },
     summary="Get supported languages",
 )
-async def get_languages(
+def get_languages(
+    request: Request,
     language_service: LanguageServiceDep
-) -> LanguagesResponse:
-    try:
-        languages = language_service.get_all_languages()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
-
-    return LanguagesResponse(
-        languages=languages,
-        count=len(languages)
+) -> Response:
+    global _cache
+
+    now = time.monotonic()
+
+    if _cache is None or now - _cache[0] >= _CACHE_TTL_SECONDS:
+        try:
+            languages = language_service.get_all_languages()
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+
+        body = LanguagesResponse(
+            languages=languages,
+            count=len(languages)
+        ).model_dump_json().encode()
+        etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+        _cache = (now, body, etag)
+
+    _, body, etag = _cache
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag},
     )
@@ -1,7 +1,17 @@
 from typing import Protocol
 
+from pydantic import TypeAdapter
+
 from app.models import LanguageInfo
 
+# Validates the whole language list in one pydantic-core call instead of
+# constructing each LanguageInfo from Python.
+_LANGUAGE_LIST_ADAPTER = TypeAdapter(list[LanguageInfo])
+
+# English and French are the scraped source languages; everything else is
+# an African target language.
+_SOURCE_LANGUAGES = frozenset(("en", "fr"))
+
 
 class LanguageRepositoryProtocol(Protocol):
     def get_all_languages_raw(self) -> list[dict]: ...
@@ -15,7 +25,17 @@ class LanguageService:
     ):
         self.language_repo = language_repo
         self.language_config = language_config or self._load_default_config()
-        self._valid_languages_cache: set[str] | None = None
+        self._valid_languages_cache: frozenset[str] | None = None
+        self._sorted_codes: tuple[str, ...] | None = None
+        self._valid_codes_str: str | None = None
+        self._language_names = {
+            "en": "English",
+            "fr": "French",
+            **{
+                config.lang_code: config.name.capitalize()
+                for config in self.language_config.values()
+            },
+        }
 
     def _load_default_config(self) -> dict:
         try:
@@ -24,18 +44,42 @@ class LanguageService:
         except ImportError:
             return {}
 
-    def get_valid_language_codes(self) -> set[str]:
+    def get_valid_language_codes(self) -> frozenset[str]:
         """
         Get set of all valid language codes.
 
+        The set is fetched once and frozen; it only changes on database
+        rebuilds, which also restart the app.
+
         Returns:
-            Set of language codes (e.g., {'en', 'fr', 'nnh', 'bfd'})
+            Frozenset of language codes (e.g., {'en', 'fr', 'nnh', 'bfd'})
         """
         if self._valid_languages_cache is None:
             raw_languages = self.language_repo.get_all_languages_raw()
-            self._valid_languages_cache = {lang["language_code"] for lang in raw_languages}
+            self._valid_languages_cache = frozenset(
+                lang["language_code"] for lang in raw_languages
+            )
         return self._valid_languages_cache
 
+    def get_sorted_codes(self) -> tuple[str, ...]:
+        """
+        Get the valid language codes as a sorted tuple (for error bodies).
+        """
+        if self._sorted_codes is None:
+            self._sorted_codes = tuple(sorted(self.get_valid_language_codes()))
+        return self._sorted_codes
+
+    def get_valid_codes_str(self) -> str:
+        """
+        Get the sorted, comma-separated valid codes string for error messages.
+
+        Built once per process so raising a validation error doesn't pay a
+        sort + join per failure.
+        """
+        if self._valid_codes_str is None:
+            self._valid_codes_str = ", ".join(self.get_sorted_codes())
+        return self._valid_codes_str
+
     def validate_language_code(self, code: str) -> bool:
         """
         Check if a language code is supported.
@@ -61,12 +105,12 @@ class LanguageService:
         Returns:
             'source' or 'target'
         """
-        if lang_code in {"en", "fr"}:
+        if lang_code in _SOURCE_LANGUAGES:
             return "source"
         return "target"
 
     def is_african_language(self, lang_code: str) -> bool:
-        return lang_code not in {"en", "fr"}
+        return lang_code not in _SOURCE_LANGUAGES
 
     def get_language_name(self, lang_code: str) -> str:
         """
@@ -78,26 +122,17 @@ class LanguageService:
         Returns:
             Language name (e.g., "English", "Ngiemboon")
         """
-        if lang_code == "en":
-            return "English"
-        elif lang_code == "fr":
-            return "French"
-        else:
-            # Look up African language name from config
-            for lang_config in self.language_config.values():
-                if lang_config.lang_code == lang_code:
-                    return lang_config.name.capitalize()
-            return lang_code.upper()
+        return self._language_names.get(lang_code, lang_code.upper())
 
     def get_all_languages(self) -> list[LanguageInfo]:
         raw_languages = self.language_repo.get_all_languages_raw()
 
-        return [
-            LanguageInfo(
-                code=lang["language_code"],
-                name=self.get_language_name(lang["language_code"]),
-                type=self.get_language_type(lang["language_code"]),
-                word_count=lang["word_count"]
-            )
+        return _LANGUAGE_LIST_ADAPTER.validate_python([
+            {
+                "code": lang["language_code"],
+                "name": self.get_language_name(lang["language_code"]),
+                "type": self.get_language_type(lang["language_code"]),
+                "word_count": lang["word_count"]
+            }
             for lang in raw_languages
-        ]
+        ])
@@ -1,9 +1,16 @@
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Protocol
 
 from app.models import TranslationResult
+from core.text import normalize_word
 from db.query_builders import MatchType, DirectionType
 
+# Hot words (autocomplete prefixes, common lookups) repeat heavily; keep
+# their built result lists in-process.
+_TRANSLATE_CACHE_SIZE = 4096
+
 
 class TranslationRepositoryProtocol(Protocol):
     def query_translations(
@@ -19,23 +26,31 @@ class TranslationRepositoryProtocol(Protocol):
 
 class LanguageServiceProtocol(Protocol):
     def validate_language_code(self, code: str) -> bool: ...
-    def get_valid_language_codes(self) -> set[str]: ...
+    def get_valid_language_codes(self) -> frozenset[str]: ...
+    def get_valid_codes_str(self) -> str: ...
+    def get_sorted_codes(self) -> tuple[str, ...]: ...
     def is_african_language(self, lang_code: str) -> bool: ...
 
 
 class LanguageValidationError(ValueError):
-    def __init__(self, language: str, valid_codes: set[str], is_source: bool = True):
+    def __init__(
+        self,
+        language: str,
+        valid_codes_str: str,
+        is_source: bool = True,
+        sorted_codes: tuple[str, ...] = ()
+    ):
         lang_type = "source" if is_source else "target"
-        valid_codes_str = ", ".join(sorted(valid_codes))
         super().__init__(
             f"Unsupported {lang_type} language: {language}. Valid codes: {valid_codes_str}"
         )
         self.language = language
-        self.valid_codes = valid_codes
+        self.valid_codes_str = valid_codes_str
         self.is_source = is_source
+        self.sorted_codes = sorted_codes
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TranslationQuery:
     source_lang: str
     word: str
@@ -52,15 +67,28 @@ class TranslationService:
     ):
         self.translation_repo = translation_repo
         self.language_service = language_service
+        # LRU of query key -> tuple of built results, guarded for the
+        # FastAPI threadpool. Results are stored as tuples so a cached
+        # entry can't be mutated by a caller.
+        self._cache: OrderedDict[tuple, tuple[TranslationResult, ...]] = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def validate_languages(self, source: str, target: str | None) -> None:
-        valid_codes = self.language_service.get_valid_language_codes()
-
         if not self.language_service.validate_language_code(source):
-            raise LanguageValidationError(source, valid_codes, is_source=True)
+            raise LanguageValidationError(
+                source,
+                self.language_service.get_valid_codes_str(),
+                is_source=True,
+                sorted_codes=self.language_service.get_sorted_codes()
+            )
 
         if target and not self.language_service.validate_language_code(target):
-            raise LanguageValidationError(target, valid_codes, is_source=False)
+            raise LanguageValidationError(
+                target,
+                self.language_service.get_valid_codes_str(),
+                is_source=False,
+                sorted_codes=self.language_service.get_sorted_codes()
+            )
 
     def determine_direction(self, source_lang: str) -> DirectionType:
         """
@@ -94,15 +122,37 @@ class TranslationService:
         """
         self.validate_languages(query.source_lang, query.target_lang)
 
+        # Normalize once at the service boundary with the same helper the
+        # migration uses to populate word_normalized, so case and
+        # diacritic-composition variants share one cache entry and the
+        # repo doesn't re-normalize.
+        word_key = normalize_word(query.word)
+        key = (query.source_lang, query.target_lang, word_key, query.match, query.limit)
+
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return list(cached)
+
         direction = self.determine_direction(query.source_lang)
 
         raw_results = self.translation_repo.query_translations(
             source_lang=query.source_lang,
-            word=query.word,
+            word=word_key,
             target_lang=query.target_lang,
             match=query.match,
             limit=query.limit,
             direction=direction
         )
 
-        return [TranslationResult(**result) for result in raw_results]
+        # Rows come from our own repository with a fixed schema, so skip
+        # pydantic validation/coercion and build the models directly.
+        results = [TranslationResult.model_construct(**result) for result in raw_results]
+
+        with self._cache_lock:
+            self._cache[key] = tuple(results)
+            if len(self._cache) > _TRANSLATE_CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+        return results
@@ -2,15 +2,17 @@ import argparse
 import asyncio
 import sys
 
-import aiohttp
-
 from core.logger import logger
 from .scrapers.languages import LANGUAGES
-from .scrapers.scraper import scrape_language, scrape_letter
+from .scrapers.scraper import make_session, scrape_language, scrape_letters
+
+# Built once at import; argparse choices and the scrape-all loop reuse it
+# instead of materializing a fresh list per use.
+_LANGUAGE_KEYS: tuple[str, ...] = tuple(LANGUAGES)
 
 EPILOG = f"""
 Available languages:
-  {', '.join(LANGUAGES.keys())}
+  {', '.join(_LANGUAGE_KEYS)}
 
 Examples:
   python src/main.py --language ngiemboon --letter a
@@ -31,7 +33,7 @@ def parse_args() -> argparse.Namespace:
         "--language",
         type=str,
         help="Language to scrape (e.g., ngiemboon, bafut)",
-        choices=list(LANGUAGES.keys()),
+        choices=_LANGUAGE_KEYS,
     )
     parser.add_argument(
         "-t",
@@ -61,31 +63,33 @@ async def main() -> None:
             logger.error("--letter requires --language to be specified")
             sys.exit(1)
 
-        # If specific language and letter(s)
-        if args.language and args.letter:
-            language_config = LANGUAGES[args.language]
-            source = "French" if args.source_language == "fr" else "English"
-            letters_str = ", ".join([l.upper() for l in args.letter])
-            logger.info(f"Scraping {language_config.name.upper()} - Letters {letters_str} ({source})")
-            async with aiohttp.ClientSession() as session:
-                for letter in args.letter:
-                    await scrape_letter(session, language_config, letter, args.source_language)
-        # If specific language but all letters
-        elif args.language:
-            language_config = LANGUAGES[args.language]
-            source = "French" if args.source_language == "fr" else "English"
-            logger.info(f"Scraping {language_config.name.upper()} - All letters ({source})")
-            await scrape_language(language_config, args.source_language)
-        # If no arguments, scrape all languages
-        else:
-            source = "French" if args.source_language == "fr" else "English"
-            logger.info(f"Scraping all languages ({source})...")
-            for language in LANGUAGES:
-                language_config = LANGUAGES[language]
-                logger.info(f"\nScraping {language_config.name.upper()}")
-                await scrape_language(language_config, args.source_language)
+        # One session for the whole run: every branch shares the same
+        # connection pool, so multi-language scrapes reuse keep-alive
+        # connections instead of redoing TCP + TLS per language.
+        async with make_session() as session:
+            # If specific language and letter(s)
+            if args.language and args.letter:
+                language_config = LANGUAGES[args.language]
+                source = "French" if args.source_language == "fr" else "English"
+                letters_str = ", ".join([l.upper() for l in args.letter])
+                logger.info("Scraping %s - Letters %s (%s)", language_config.name.upper(), letters_str, source)
+                await scrape_letters(session, language_config, args.letter, args.source_language)
+            # If specific language but all letters
+            elif args.language:
+                language_config = LANGUAGES[args.language]
+                source = "French" if args.source_language == "fr" else "English"
+                logger.info("Scraping %s - All letters (%s)", language_config.name.upper(), source)
+                await scrape_language(language_config, args.source_language, session)
+            # If no arguments, scrape all languages
+            else:
+                source = "French" if args.source_language == "fr" else "English"
+                logger.info("Scraping all languages (%s)...", source)
+                for language in _LANGUAGE_KEYS:
+                    language_config = LANGUAGES[language]
+                    logger.info("\nScraping %s", language_config.name.upper())
+                    await scrape_language(language_config, args.source_language, session)
     except Exception as e:
-        logger.error(f"Fatal error during scraping: {e}", exc_info=True)
+        logger.error("Fatal error during scraping: %s", e, exc_info=True)
         sys.exit(1)
 
 
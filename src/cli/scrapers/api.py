@@ -13,18 +13,21 @@ async def fetch_html(session: ClientSession, url: str) -> BeautifulSoup:
             async with session.get(url, headers=HEADERS, timeout=timeout) as resp:
                 resp.raise_for_status()
                 html = await resp.text()
-                return BeautifulSoup(html, "html.parser")
+                # lxml parses in C, roughly an order of magnitude faster
+                # than the pure-Python "html.parser" — parsing dominates
+                # CPU time across a full scrape run.
+                return BeautifulSoup(html, "lxml")
         except ClientResponseError as e:
             if e.status == 503 and attempt < MAX_RETRIES - 1:
                 delay = RETRY_BASE_DELAY * (2 ** attempt)
-                logger.warning(f"  ⚠ Rate limited (503), retrying in {delay}s (attempt {attempt + 1}/{MAX_RETRIES})")
+                logger.warning("  ⚠ Rate limited (503), retrying in %ss (attempt %d/%d)", delay, attempt + 1, MAX_RETRIES)
                 await asyncio.sleep(delay)
             else:
                 raise
         except Exception as e:
             if attempt < MAX_RETRIES - 1:
                 delay = RETRY_BASE_DELAY * (2 ** attempt)
-                logger.warning(f"  ⚠ Request failed: {e}, retrying in {delay}s (attempt {attempt + 1}/{MAX_RETRIES})")
+                logger.warning("  ⚠ Request failed: %s, retrying in %ss (attempt %d/%d)", e, delay, attempt + 1, MAX_RETRIES)
                 await asyncio.sleep(delay)
             else:
                 raise
@@ -7,6 +7,9 @@ HEADERS: dict[str, str] = {
 }
 
 REQUEST_TIMEOUT: int = 30
+CONNECTION_LIMIT: int = 64  # Max pooled connections per ClientSession
+DNS_CACHE_TTL: int = 300  # How long to cache DNS lookups (seconds)
+LETTER_CONCURRENCY: int = 8  # Max letters scraped concurrently
 PAGE_DELAY: float = 3.0  # Base delay between pages (seconds)
 LETTER_DELAY: float = 8.0  # Base delay between letters (seconds)
 JITTER_MIN: float = 0.5  # Minimum random jitter to add (seconds)
@@ -14,8 +17,19 @@ JITTER_MAX: float = 2.0  # Maximum random jitter to add (seconds)
 MAX_RETRIES: int = 3  # Maximum number of retries for failed requests
 RETRY_BASE_DELAY: float = 5.0  # Base delay for exponential backoff (seconds)
 
+# Per-language query templates with the source language baked in, so
+# each call substitutes only the letter and page.
+_QUERY_TEMPLATES: dict[str, str] = {
+    lang: f"?letter={{letter}}&key={lang}&pagenr={{page}}&lang={lang}"
+    for lang in ("en", "fr")
+}
+
+
 def build_query_params(source_lang: str, letter: str, page: int) -> str:
     """
     Build query parameters for webonary.org URLs.
     """
-    return f"?letter={letter}&key={source_lang}&pagenr={page}&lang={source_lang}"
+    template = _QUERY_TEMPLATES.get(source_lang)
+    if template is None:
+        return f"?letter={letter}&key={source_lang}&pagenr={page}&lang={source_lang}"
+    return template.format(letter=letter, page=page)
@@ -1,9 +1,14 @@
 import re
+
+import soupsieve
 from bs4 import BeautifulSoup, Tag
 from typing import List
 
 from .models import DictionaryEntry, VernacularTranslation
 
+# Compiled once instead of re-parsed inside the per-entry loop
+_SENSE_SELECTOR = soupsieve.compile("span.sensesr")
+
 
 def extract_total_pages(soup: BeautifulSoup) -> int:
     pagination = soup.find("div", id="wp_page_numbers")
@@ -21,7 +26,7 @@ def extract_total_pages(soup: BeautifulSoup) -> int:
 def extract_translations(entry: Tag, lang_code: str) -> List[VernacularTranslation]:
     results: List[VernacularTranslation] = []
 
-    for sense in entry.find_all("span", class_="sensesr"):
+    for sense in _SENSE_SELECTOR.iselect(entry):
         headword = sense.find("span", class_="headword")
         if not headword:
             continue
@@ -30,6 +35,9 @@ def extract_translations(entry: Tag, lang_code: str) -> List[VernacularTranslati
         if not link_el:
             continue
 
+        # Deliberately nested rather than one CSS selector: links nested
+        # under several lang-tagged spans must contribute once per
+        # matching ancestor (webonary repeats the headword this way).
         parts: list[str] = []
         for span in headword.find_all("span", lang=lang_code):
             for a in span.find_all("a"):
@@ -1,7 +1,8 @@
-import json
 from pathlib import Path
 from typing import List
 
+import orjson
+
 from .models import DictionaryEntry
 
 
@@ -20,8 +21,11 @@ def save_letter_json(
     # Use appropriate key based on source language
     source_key = "french" if source_lang == "fr" else "english"
 
-    with output_file.open("w", encoding="utf-8") as f:
-        json.dump(
+    # orjson serializes straight to UTF-8 bytes in native code, so the
+    # file is written with one write_bytes call instead of the Python
+    # encoder streaming characters through a text wrapper.
+    output_file.write_bytes(
+        orjson.dumps(
             [
                 {
                     source_key: e.source_word,
@@ -32,7 +36,6 @@ def save_letter_json(
                 }
                 for e in entries
             ],
-            f,
-            ensure_ascii=False,
-            indent=2,
+            option=orjson.OPT_INDENT_2,
         )
+    )
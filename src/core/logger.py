@@ -16,17 +16,25 @@ class ColoredFormatter(logging.Formatter):
     RESET = "\033[0m"
     BOLD = "\033[1m"
 
+    # The level → colorized-levelname mapping is static, so build each
+    # string once at class definition instead of per record.
+    COLORED_LEVELNAMES = {
+        levelname: f"{color}\033[1m{levelname}\033[0m"
+        for levelname, color in COLORS.items()
+    }
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with colors."""
-        levelname = record.levelname
-        if levelname in self.COLORS:
-            record.levelname = (
-                f"{self.COLORS[levelname]}{self.BOLD}{levelname}{self.RESET}"
-            )
-
-        formatted = super().format(record)
-
-        return formatted
+        original_levelname = record.levelname
+        record.levelname = self.COLORED_LEVELNAMES.get(
+            original_levelname, original_levelname
+        )
+        try:
+            return super().format(record)
+        finally:
+            # Restore the plain levelname so other handlers (or a second
+            # format pass) don't see the ANSI-wrapped value.
+            record.levelname = original_levelname
 
 
 def setup_logger(
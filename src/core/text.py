@@ -0,0 +1,17 @@
+"""Shared text normalization helpers."""
+
+import unicodedata
+
+
+def normalize_word(word: str) -> str:
+    """
+    Normalize a word for case-insensitive matching.
+
+    NFC composes combining diacritics into single code points so that
+    visually identical words compare equal regardless of how they were
+    typed, and casefold() handles unicode case pairs that .lower()
+    misses. Every writer of word_normalized and every query against it
+    must go through this one function — the column is only useful if
+    both sides agree on the normalization.
+    """
+    return unicodedata.normalize("NFC", word).casefold()
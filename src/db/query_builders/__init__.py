@@ -1,11 +1,17 @@
 from .base import QueryResult, QueryBuilder
-from .translation_query_builder import TranslationQueryBuilder, MatchType, DirectionType
+from .translation_query_builder import (
+    TranslationQueryBuilder,
+    MatchType,
+    DirectionType,
+    build_batch_query,
+)
 from .language_query_builder import LanguageQueryBuilder
 
 __all__ = [
     "QueryResult",
     "QueryBuilder",
     "TranslationQueryBuilder",
+    "build_batch_query",
     "LanguageQueryBuilder",
     "MatchType",
     "DirectionType",
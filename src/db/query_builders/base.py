@@ -12,7 +12,7 @@ class Cursor(Protocol):
     def fetchall(self) -> list[Any]: ...
 
 
-@dataclass
+@dataclass(slots=True)
 class QueryResult:
     sql: str
     params: list
@@ -5,10 +5,11 @@ from .base import QueryResult
 @dataclass
 class LanguageQueryBuilder:
     def build_all_languages_query(self) -> QueryResult:
+        # Reads the language_stats table materialized at the end of
+        # migration instead of re-aggregating the words table per call.
         sql = """
-            SELECT language_code, COUNT(*) as word_count
-            FROM words
-            GROUP BY language_code
+            SELECT language_code, word_count
+            FROM language_stats
             ORDER BY language_code
         """
         return QueryResult(sql=sql, params=[])
@@ -1,12 +1,123 @@
 from dataclasses import dataclass
 from typing import Literal
+
+from core.text import normalize_word
+
 from .base import QueryResult
 
 MatchType = Literal["exact", "prefix", "contains"]
 DirectionType = Literal["forward", "reverse"]
 
+# Word-condition fragments keyed by condition kind. "contains" maps to
+# two kinds because sub-trigram needles fall back to LIKE. Prefix uses
+# GLOB rather than LIKE: GLOB is case-sensitive, so SQLite rewrites a
+# literal-prefix pattern into an index range scan, while LIKE (case-
+# insensitive by default) cannot use the b-tree at all.
+_WORD_CONDITIONS = {
+    "exact": "source.word_normalized = ?",
+    "prefix": "source.word_normalized GLOB ?",
+    "contains_fts": "source.id IN (SELECT rowid FROM words_fts WHERE words_fts MATCH ?)",
+    "contains_like": "source.word_normalized LIKE ? ESCAPE '\\'",
+}
+
+# GLOB's wildcards are neutralized by wrapping each in a single-character
+# class; LIKE's by a backslash escape (declared via the ESCAPE clause).
+# Without this, a user searching for a literal '*' or '_' matches far
+# more than intended.
+_GLOB_ESCAPES = str.maketrans({"[": "[[]", "*": "[*]", "?": "[?]"})
+
+
+def _escape_like(word: str) -> str:
+    return word.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+_TARGET_CONDITION = "AND target.language_code = ?"
+
+
+def _render_query(direction: DirectionType, word_condition: str, target_condition: str) -> str:
+    if direction == "forward":
+        return f"""
+                SELECT
+                    source.word as source_word,
+                    source.language_code as source_language,
+                    target.word as target_word,
+                    target.language_code as target_language,
+                    target.webonary_link as webonary_link
+                FROM words source
+                JOIN translations t ON source.id = t.source_word_id
+                JOIN words target ON t.target_word_id = target.id
+                WHERE source.language_code = ?
+                  AND {word_condition}
+                  {target_condition}
+                ORDER BY target.word
+                LIMIT ?
+            """
+    else:  # reverse
+        return f"""
+                SELECT
+                    source.word as source_word,
+                    source.language_code as source_language,
+                    target.word as target_word,
+                    target.language_code as target_language,
+                    source.webonary_link as webonary_link
+                FROM words source
+                JOIN translations t ON source.id = t.target_word_id
+                JOIN words target ON t.source_word_id = target.id
+                WHERE source.language_code = ?
+                  AND {word_condition}
+                  {target_condition}
+                ORDER BY target.word
+                LIMIT ?
+            """
+
 
-@dataclass
+# Every query variant rendered once at import. Reusing the exact same
+# SQL text per variant lets SQLite's per-connection statement cache skip
+# the parse/plan step, and build() becomes a dict lookup plus parameter
+# binding.
+_SQL_TABLE: dict[tuple[str, str, bool], str] = {
+    (direction, condition_kind, has_target): _render_query(
+        direction,
+        word_condition,
+        _TARGET_CONDITION if has_target else "",
+    )
+    for direction in ("forward", "reverse")
+    for condition_kind, word_condition in _WORD_CONDITIONS.items()
+    for has_target in (False, True)
+}
+
+
+# frozen matches how the builder is used — with_target/with_limit
+# already return fresh instances instead of mutating — and slots drop
+# the per-instance __dict__ for these short-lived hot-path objects.
+def build_batch_query(
+    source_lang: str,
+    words: list[str],
+    direction: DirectionType = "forward",
+    target_lang: str | None = None,
+    limit: int = 100,
+) -> QueryResult:
+    """Build one exact-match query covering several words at once.
+
+    Callers that would otherwise loop over single-word queries pay one
+    round-trip per word; an IN list collapses them into a single
+    statement. Batch lookups are exact-match only — prefix and contains
+    patterns don't compose into an IN list.
+    """
+    normalized = [normalize_word(word) for word in words]
+    placeholders = ", ".join("?" * len(normalized))
+    sql = _render_query(
+        direction,
+        f"source.word_normalized IN ({placeholders})",
+        _TARGET_CONDITION if target_lang is not None else "",
+    )
+    params: list = [source_lang, *normalized]
+    if target_lang is not None:
+        params.append(target_lang)
+    params.append(limit)
+    return QueryResult(sql=sql, params=params)
+
+
+@dataclass(slots=True, frozen=True)
 class TranslationQueryBuilder:
     source_lang: str
     word: str
@@ -16,10 +127,10 @@ class TranslationQueryBuilder:
     limit: int = 10
 
     def build(self) -> QueryResult:
-        word_normalized = self.word.lower()
-        word_condition, word_param = self._build_word_condition(word_normalized)
-        target_condition, params = self._build_params(word_param)
-        sql = self._build_query(word_condition, target_condition)
+        word_normalized = normalize_word(self.word)
+        condition_kind, word_param = self._build_word_condition(word_normalized)
+        params = self._build_params(word_param)
+        sql = _SQL_TABLE[(self.direction, condition_kind, self.target_lang is not None)]
 
         return QueryResult(sql=sql, params=params)
 
@@ -44,59 +155,26 @@ class TranslationQueryBuilder:
         )
 
     def _build_word_condition(self, word_normalized: str) -> tuple[str, str]:
+        """Return the (condition kind, bound parameter) for the match type."""
         if self.match == "exact":
-            return "source.word_normalized = ?", word_normalized
+            return "exact", word_normalized
         elif self.match == "prefix":
-            return "source.word_normalized LIKE ?", f"{word_normalized}%"
+            return "prefix", f"{word_normalized.translate(_GLOB_ESCAPES)}*"
         elif self.match == "contains":
-            return "source.word_normalized LIKE ?", f"%{word_normalized}%"
+            # Substring search goes through the trigram FTS index, which
+            # is an inverted-index probe instead of a LIKE scan of every
+            # row. The trigram tokenizer needs at least three characters;
+            # shorter needles fall back to LIKE.
+            if len(word_normalized) >= 3:
+                quoted = word_normalized.replace('"', '""')
+                return "contains_fts", f'"{quoted}"'
+            return "contains_like", f"%{_escape_like(word_normalized)}%"
         else:
             raise ValueError(
                 f"Invalid match type: {self.match}. Must be 'exact', 'prefix', or 'contains'"
             )
 
-    def _build_params(self, word_param: str) -> tuple[str, list]:
+    def _build_params(self, word_param: str) -> list:
         if self.target_lang:
-            condition = "AND target.language_code = ?"
-            params = [self.source_lang, word_param, self.target_lang, self.limit]
-        else:
-            condition = ""
-            params = [self.source_lang, word_param, self.limit]
-
-        return condition, params
-
-    def _build_query(self, word_condition: str, target_condition: str) -> str:
-        if self.direction == "forward":
-            return f"""
-                SELECT
-                    source.word as source_word,
-                    source.language_code as source_language,
-                    target.word as target_word,
-                    target.language_code as target_language,
-                    target.webonary_link as webonary_link
-                FROM words source
-                JOIN translations t ON source.id = t.source_word_id
-                JOIN words target ON t.target_word_id = target.id
-                WHERE source.language_code = ?
-                  AND {word_condition}
-                  {target_condition}
-                ORDER BY target.word
-                LIMIT ?
-            """
-        else:  # reverse
-            return f"""
-                SELECT
-                    source.word as source_word,
-                    source.language_code as source_language,
-                    target.word as target_word,
-                    target.language_code as target_language,
-                    source.webonary_link as webonary_link
-                FROM words source
-                JOIN translations t ON source.id = t.target_word_id
-                JOIN words target ON t.source_word_id = target.id
-                WHERE source.language_code = ?
-                  AND {word_condition}
-                  {target_condition}
-                ORDER BY target.word
-                LIMIT ?
-            """
+            return [self.source_lang, word_param, self.target_lang, self.limit]
+        return [self.source_lang, word_param, self.limit]
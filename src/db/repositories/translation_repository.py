@@ -1,5 +1,7 @@
+from core.text import normalize_word
+
 from .base import BaseRepository
-from ..query_builders import TranslationQueryBuilder, MatchType, DirectionType
+from ..query_builders import TranslationQueryBuilder, MatchType, DirectionType, build_batch_query
 
 
 class TranslationRepository(BaseRepository):
@@ -59,30 +61,82 @@ class TranslationRepository(BaseRepository):
 
         query_result = builder.build()
 
-        # Execute and convert to dicts
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            rows = query_result.execute(cursor)
-
-            return self._rows_to_dicts(rows)
-
-    def _rows_to_dicts(self, rows: list) -> list[dict]:
+            # Plain tuples for this hot query: each sqlite3.Row field
+            # access scans the column description by name, and the Row
+            # allocation itself is pure overhead when every row is
+            # converted to a dict anyway. Column order matches the
+            # SELECT in the query builder.
+            cursor.row_factory = None
+            # The LIMIT clause bounds the result set, so size the fetch
+            # buffer to it and pull every row in one batch.
+            cursor.arraysize = limit
+            cursor.execute(query_result.sql, query_result.params)
+
+            return [
+                {
+                    "source_word": source_word,
+                    "source_language": source_language,
+                    "target_word": target_word,
+                    "target_language": target_language,
+                    "webonary_link": webonary_link
+                }
+                for source_word, source_language, target_word, target_language, webonary_link
+                in cursor.fetchall()
+            ]
+
+    def query_translations_batch(
+        self,
+        source_lang: str,
+        words: list[str],
+        target_lang: str | None = None,
+        limit: int = 100,
+        direction: DirectionType = "forward"
+    ) -> dict[str, list[dict]]:
         """
-        Convert database rows to dictionaries.
+        Look up exact translations for several words in one query.
+
+        Callers translating a list of words would otherwise issue one
+        round-trip per word; this collapses them into a single IN-list
+        query. Exact match only.
 
         Args:
-            rows: List of sqlite3.Row objects
+            source_lang: Source language code
+            words: Words to translate
+            target_lang: Target language code (None for all languages)
+            limit: Maximum total rows across the whole batch
+            direction: Query direction (forward or reverse)
 
         Returns:
-            List of dictionaries with translation data
+            Dict mapping each input word to its list of translation
+            dictionaries (same keys as query_translations). Words with
+            no translations map to an empty list.
         """
-        return [
-            {
-                "source_word": row["source_word"],
-                "source_language": row["source_language"],
-                "target_word": row["target_word"],
-                "target_language": row["target_language"],
-                "webonary_link": row["webonary_link"]
-            }
-            for row in rows
-        ]
+        query_result = build_batch_query(
+            source_lang=source_lang,
+            words=words,
+            direction=direction,
+            target_lang=target_lang,
+            limit=limit
+        )
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.arraysize = limit
+            cursor.execute(query_result.sql, query_result.params)
+            rows = cursor.fetchall()
+
+        # Group rows back under the caller's original words; rows carry
+        # the stored (display) form, so match on the normalized column.
+        by_normalized: dict[str, list[dict]] = {normalize_word(word): [] for word in words}
+        for source_word, source_language, target_word, target_language, webonary_link in rows:
+            by_normalized[normalize_word(source_word)].append({
+                "source_word": source_word,
+                "source_language": source_language,
+                "target_word": target_word,
+                "target_language": target_language,
+                "webonary_link": webonary_link
+            })
+        return {word: by_normalized[normalize_word(word)] for word in words}
@@ -54,10 +54,34 @@ def sample_db(test_db_path):
     """)
 
     # Create indexes
-    cursor.execute("CREATE INDEX idx_words_normalized ON words(word_normalized, language_code)")
+    cursor.execute("""
+        CREATE UNIQUE INDEX idx_words_identity
+        ON words(word, language_code, COALESCE(webonary_link, ''))
+    """)
+    cursor.execute("""
+        CREATE INDEX idx_words_covering
+        ON words(language_code, word_normalized, id, word, webonary_link)
+    """)
     cursor.execute("CREATE INDEX idx_words_language ON words(language_code)")
-    cursor.execute("CREATE INDEX idx_translations_source ON translations(source_word_id)")
-    cursor.execute("CREATE INDEX idx_translations_target ON translations(target_word_id)")
+    cursor.execute("CREATE INDEX idx_translations_target ON translations(target_word_id, source_word_id)")
+
+    # Trigram FTS index used by "contains" queries (kept in sync by the
+    # insert trigger, mirroring the migration schema)
+    cursor.execute("""
+        CREATE VIRTUAL TABLE words_fts USING fts5(
+            word_normalized,
+            language_code UNINDEXED,
+            content='words',
+            content_rowid='id',
+            tokenize='trigram'
+        )
+    """)
+    cursor.execute("""
+        CREATE TRIGGER words_fts_insert AFTER INSERT ON words BEGIN
+            INSERT INTO words_fts(rowid, word_normalized, language_code)
+            VALUES (new.id, new.word_normalized, new.language_code);
+        END
+    """)
 
     # Insert sample words
     # English words
@@ -128,6 +152,14 @@ def sample_db(test_db_path):
     cursor.execute("INSERT INTO translations (source_word_id, target_word_id) VALUES (?, ?)",
                    (fr_bonjour_id, nnh_mbwamno_id))
 
+    # Materialized per-language counts, mirroring the migration output
+    cursor.execute("""
+        CREATE TABLE language_stats AS
+        SELECT language_code, COUNT(*) AS word_count
+        FROM words
+        GROUP BY language_code
+    """)
+
     conn.commit()
     conn.close()
 
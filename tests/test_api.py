@@ -24,9 +24,12 @@ def override_db(sample_db):
     os.environ["VERNALA_DB_PATH"] = sample_db
     dependencies.DEFAULT_DB_PATH = sample_db
 
-    # Clear cached dependencies to pick up new database path
-    dependencies.get_translation_repository.cache_clear()
-    dependencies.get_language_repository.cache_clear()
+    # Rebuild the dependency singletons against the test database
+    dependencies.reset_dependencies(sample_db)
+
+    # Drop any cached /languages response from a previous test
+    from app.routes import languages_router
+    languages_router._cache = None
 
     yield sample_db
 
@@ -36,9 +39,8 @@ def override_db(sample_db):
     else:
         os.environ.pop("VERNALA_DB_PATH", None)
 
-    # Clear cache again to reset
-    dependencies.get_translation_repository.cache_clear()
-    dependencies.get_language_repository.cache_clear()
+    # Rebuild singletons against the default database again
+    dependencies.reset_dependencies()
 
 
 class TestHealthEndpoint:
@@ -93,6 +95,34 @@ class TestLanguagesEndpoint:
         assert "fr" in codes
         assert "nnh" in codes
 
+    def test_languages_response_has_etag(self, client, override_db):
+        """Test that /languages responses carry an ETag header."""
+        response = client.get("/languages")
+
+        assert response.status_code == 200
+        assert response.headers.get("etag")
+
+    def test_languages_returns_304_when_etag_matches(self, client, override_db):
+        """Test that a matching If-None-Match returns 304 Not Modified."""
+        first = client.get("/languages")
+        etag = first.headers["etag"]
+
+        second = client.get("/languages", headers={"If-None-Match": etag})
+
+        assert second.status_code == 304
+        assert second.headers.get("etag") == etag
+
+    def test_languages_openapi_schema_is_typed(self, client):
+        """Test that the documented 200 schema survives the byte cache.
+
+        The handler returns a pre-serialized Response, so the schema
+        comes from response_model on the decorator — this pins it.
+        """
+        schema = app.openapi()["paths"]["/languages"]["get"]["responses"]["200"]
+
+        ref = schema["content"]["application/json"]["schema"]["$ref"]
+        assert ref == "#/components/schemas/LanguagesResponse"
+
 
 class TestTranslateEndpoint:
     """Tests for /translate endpoint."""
@@ -246,7 +276,10 @@ class TestTranslateEndpoint:
         })
 
         assert response.status_code == 400
-        assert "Unsupported source language" in response.json()["detail"]
+        detail = response.json()["detail"]
+        assert "Unsupported source language" in detail["message"]
+        assert detail["language"] == "xyz"
+        assert "en" in detail["valid"]
 
     def test_invalid_target_language(self, client, override_db):
         """Test that invalid target language returns 400."""
@@ -257,7 +290,9 @@ class TestTranslateEndpoint:
         })
 
         assert response.status_code == 400
-        assert "Unsupported target language" in response.json()["detail"]
+        detail = response.json()["detail"]
+        assert "Unsupported target language" in detail["message"]
+        assert detail["language"] == "xyz"
 
     def test_missing_required_parameters(self, client):
         """Test that missing required parameters returns 422."""
@@ -318,6 +353,31 @@ class TestTranslateEndpoint:
         data = response.json()
         assert data["query"]["match"] == "exact"
 
+    def test_translate_response_has_etag_and_cache_control(self, client, override_db):
+        """Test that /translate responses carry caching headers."""
+        response = client.get("/translate", params={
+            "source": "en",
+            "target": "nnh",
+            "word": "abandon"
+        })
+
+        assert response.status_code == 200
+        assert response.headers.get("etag")
+        assert response.headers.get("cache-control") == "public, max-age=300"
+
+    def test_translate_returns_304_when_etag_matches(self, client, override_db):
+        """Test that a matching If-None-Match returns 304 Not Modified."""
+        params = {"source": "en", "target": "nnh", "word": "abandon"}
+        first = client.get("/translate", params=params)
+        etag = first.headers["etag"]
+
+        second = client.get(
+            "/translate", params=params, headers={"If-None-Match": etag}
+        )
+
+        assert second.status_code == 304
+        assert second.headers.get("etag") == etag
+
     def test_default_limit_is_10(self, client, override_db):
         """Test that default limit is 10."""
         response = client.get("/translate", params={
@@ -2,7 +2,8 @@ import pytest
 from db.query_builders import (
     TranslationQueryBuilder,
     LanguageQueryBuilder,
-    QueryResult
+    QueryResult,
+    build_batch_query
 )
 
 
@@ -78,11 +79,11 @@ class TestTranslationQueryBuilder:
 
         result = builder.build()
 
-        assert "source.word_normalized LIKE ?" in result.sql
-        assert result.params[1] == "aban%"
+        assert "source.word_normalized GLOB ?" in result.sql
+        assert result.params[1] == "aban*"
 
     def test_build_contains_match(self):
-        """Test contains match query."""
+        """Test contains match query uses the trigram FTS index."""
         builder = TranslationQueryBuilder(
             source_lang="en",
             word="llo",
@@ -92,8 +93,49 @@ class TestTranslationQueryBuilder:
 
         result = builder.build()
 
+        assert "words_fts MATCH ?" in result.sql
+        assert result.params[1] == '"llo"'
+
+    def test_build_contains_short_word_falls_back_to_like(self):
+        """Test that sub-trigram needles fall back to a LIKE scan."""
+        builder = TranslationQueryBuilder(
+            source_lang="en",
+            word="lo",
+            direction="forward",
+            match="contains"
+        )
+
+        result = builder.build()
+
         assert "source.word_normalized LIKE ?" in result.sql
-        assert result.params[1] == "%llo%"
+        assert result.params[1] == "%lo%"
+
+    def test_prefix_match_escapes_glob_wildcards(self):
+        """Test that GLOB metacharacters in the word are matched literally."""
+        builder = TranslationQueryBuilder(
+            source_lang="en",
+            word="a*b?",
+            direction="forward",
+            match="prefix"
+        )
+
+        result = builder.build()
+
+        assert result.params[1] == "a[*]b[?]*"
+
+    def test_contains_match_escapes_like_wildcards(self):
+        """Test that LIKE wildcards in short words are matched literally."""
+        builder = TranslationQueryBuilder(
+            source_lang="en",
+            word="a_",
+            direction="forward",
+            match="contains"
+        )
+
+        result = builder.build()
+
+        assert "ESCAPE" in result.sql
+        assert result.params[1] == "%a\\_%"
 
     def test_invalid_match_type_raises_error(self):
         """Test that invalid match type raises ValueError."""
@@ -150,6 +192,20 @@ class TestTranslationQueryBuilder:
         # Word parameter should be lowercase
         assert result.params[1] == "abandon"
 
+    def test_unicode_word_normalization(self):
+        """Test that decomposed diacritics are composed before binding."""
+        builder = TranslationQueryBuilder(
+            source_lang="nnh",
+            word="ńnyé",  # ńnyé typed with combining accents
+            direction="reverse",
+            match="exact"
+        )
+
+        result = builder.build()
+
+        # Bound parameter is NFC-composed, matching word_normalized
+        assert result.params[1] == "ńnyé"
+
     def test_forward_query_structure(self):
         """Test that forward queries have correct JOIN structure."""
         builder = TranslationQueryBuilder(
@@ -204,6 +260,29 @@ class TestTranslationQueryBuilder:
         assert result_without.params[-1] == 15
 
 
+class TestBuildBatchQuery:
+    """Unit tests for build_batch_query."""
+
+    def test_batch_query_in_list(self):
+        """Test that the batch query binds one placeholder per word."""
+        result = build_batch_query(
+            source_lang="en",
+            words=["Abandon", "hello"],
+            target_lang="nnh",
+            limit=50
+        )
+
+        assert "source.word_normalized IN (?, ?)" in result.sql
+        assert result.params == ["en", "abandon", "hello", "nnh", 50]
+
+    def test_batch_query_without_target(self):
+        """Test batch query without a target language filter."""
+        result = build_batch_query(source_lang="en", words=["hello"])
+
+        assert "AND target.language_code = ?" not in result.sql
+        assert result.params == ["en", "hello", 100]
+
+
 class TestLanguageQueryBuilder:
     """Unit tests for LanguageQueryBuilder."""
 
@@ -214,9 +293,8 @@ class TestLanguageQueryBuilder:
         result = builder.build_all_languages_query()
 
         assert isinstance(result, QueryResult)
-        assert "SELECT language_code, COUNT(*) as word_count" in result.sql
-        assert "FROM words" in result.sql
-        assert "GROUP BY language_code" in result.sql
+        assert "SELECT language_code, word_count" in result.sql
+        assert "FROM language_stats" in result.sql
         assert "ORDER BY language_code" in result.sql
         assert result.params == []
 
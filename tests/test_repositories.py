@@ -155,6 +155,17 @@ class TestTranslationRepository:
                 direction="forward"
             )
 
+    def test_query_translations_batch(self, translation_repo):
+        """Test batch lookup groups results under each input word."""
+        results = translation_repo.query_translations_batch(
+            "en", ["abandon", "hello", "missing"], target_lang="nnh"
+        )
+
+        assert set(results) == {"abandon", "hello", "missing"}
+        assert {r["target_word"] for r in results["abandon"]} == {"ńnyé2ńnyé", "ńkʉ́e"}
+        assert len(results["hello"]) == 1
+        assert results["missing"] == []
+
     def test_query_translations_webonary_link_forward(self, translation_repo):
         """Test that webonary links are included in forward lookup."""
         results = translation_repo.query_translations(
@@ -248,6 +259,23 @@ class TestBaseRepository:
         assert len(rows) == 3
         assert all(row["language_code"] == "en" for row in rows)
 
+    def test_executemany(self, sample_db):
+        """Test _executemany inserts a batch in one transaction."""
+        from db.repositories import BaseRepository
+
+        repo = BaseRepository(sample_db)
+
+        repo._executemany(
+            "INSERT INTO words (word, word_normalized, language_code) VALUES (?, ?, ?)",
+            [("goodbye", "goodbye", "en"), ("au revoir", "au revoir", "fr")]
+        )
+
+        rows = repo._execute_query(
+            "SELECT word FROM words WHERE word_normalized IN (?, ?)",
+            ["goodbye", "au revoir"]
+        )
+        assert len(rows) == 2
+
     def test_db_path_configuration(self, sample_db):
         """Test that db_path is configurable."""
         from db.repositories import BaseRepository
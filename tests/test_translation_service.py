@@ -27,7 +27,13 @@ class MockLanguageService:
         return code in {"en", "fr", "nnh", "bfd"}
 
     def get_valid_language_codes(self):
-        return {"en", "fr", "nnh", "bfd"}
+        return frozenset({"en", "fr", "nnh", "bfd"})
+
+    def get_valid_codes_str(self):
+        return ", ".join(self.get_sorted_codes())
+
+    def get_sorted_codes(self):
+        return tuple(sorted(self.get_valid_language_codes()))
 
     def is_african_language(self, lang_code):
         return lang_code not in {"en", "fr"}